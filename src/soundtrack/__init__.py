@@ -1,3 +1,12 @@
-from .soundtrack import Soundtrack
-from . import video
-from . import maker
+import importlib
+
+
+def __getattr__(name: str):
+    # submodules pull in numpy, mutagen, PIL, etc., so only import them when
+    # they're actually used (running `python -m soundtrack --help` shouldn't need them)
+    if name == 'Soundtrack':
+        from .soundtrack import Soundtrack
+        return Soundtrack
+    if name in ('video', 'maker'):
+        return importlib.import_module(f'.{name}', __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,164 +1,300 @@
 import sys
 import argparse
 import logging
-import numpy
+import typing
 
+LOG_LEVEL_NAMES = ('CRITICAL', 'ERROR', 'WARNING', 'INFO', 'DEBUG', 'NOTSET')
+LOG_LEVEL_HELP = 'log level {' + ', '.join(LOG_LEVEL_NAMES) + '}'
 
-from .soundtrack import Soundtrack
-from .maker import SoundtrackMaker
 
 def setup_logger(level = logging.INFO):
     if isinstance(level, str):
-        level = logging._nameToLevel.get(level.upper(), logging.INFO)
+        level = logging.getLevelName(level.upper())
+        if not isinstance(level, int):
+            level = logging.INFO
     
-    logging.basicConfig(
-        level = level,
-        format = '[%(levelname)s] %(message)s',
-    )
+    root = logging.getLogger()
+    if not root.handlers:
+        handler = logging.StreamHandler()
+        handler.setFormatter(logging.Formatter('[%(levelname)s] %(message)s'))
+        root.addHandler(handler)
+    root.setLevel(level)
     logging.captureWarnings(True)
-    numpy.seterr(all = 'warn')
 
 
-if __name__ == "__main__":
+TAG_ARGUMENTS: tuple[tuple[tuple[str, ...], dict[str, typing.Any]], ...] = (
+    (
+        ('input',),
+        dict(
+            help = 'input soundtrack folder',
+        ),
+    ),
+    (
+        ('--output', '-o'),
+        dict(
+            dest = 'output',
+            help = 'Output folder to put the soundtrack in. If ommitted, it will modify the original files.',
+        ),
+    ),
+    (
+        ('--artist', '-ar'),
+        dict(
+            dest = 'artist',
+            help = 'Artist or composer.',
+        ),
+    ),
+    (
+        ('--title', '-ti'),
+        dict(
+            dest = 'title',
+            help = 'Track title. This can be regex to get the title from the filename.',
+        ),
+    ),
+    (
+        ('--track', '-tr'),
+        dict(
+            dest = 'track',
+            help = 'Track number. This can be regex to get the track from the filename.',
+        ),
+    ),
+    (
+        ('--band', '-b'),
+        dict(
+            dest = 'band',
+            help = 'Album artist / band',
+        ),
+    ),
+    (
+        ('--album', '-al'),
+        dict(
+            dest = 'album',
+            help = 'Album title',
+        ),
+    ),
+    (
+        ('--publisher', '-p'),
+        dict(
+            dest = 'publisher',
+            help = 'Publisher',
+        ),
+    ),
+    (
+        ('--genre', '-g'),
+        dict(
+            dest = 'genre',
+            help = 'Genre(s)',
+            nargs = '*',
+        ),
+    ),
+    (
+        ('--disc', '-d'),
+        dict(
+            dest = 'disc',
+            help = 'Disc number. This can be regex to get the disc from the filename.',
+        ),
+    ),
+    (
+        ('--cover', '-c'),
+        dict(
+            dest = 'cover',
+            help = 'Cover art image.',
+        ),
+    ),
+    (
+        ('--clear',),
+        dict(
+            dest = 'clear',
+            help = 'Clear metadata before writing',
+            action = 'store_true',
+        ),
+    ),
+    (
+        ('--spreadsheet', '-s'),
+        dict(
+            dest = 'spreadsheet',
+            help = 'Add a metadata spreadsheet. This csv will have a header, and it will match the first column then add the specified metadata tags.',
+        ),
+    ),
+)
+
+def build_tag_parser(subparsers: argparse._SubParsersAction):
+    tag = subparsers.add_parser(
+        'tag',
+        help = 'add metadata to a soundtrack',
+    )
+
+    for flags, options in TAG_ARGUMENTS:
+        tag.add_argument(*flags, **options)
+    
+    return tag
+
+def build_create_parser(subparsers: argparse._SubParsersAction):
+    create = subparsers.add_parser(
+        'create',
+        help = 'Create and loop audio files in a soundtrack. More information can be found at https://github.com/ego-lay-atman-bay/python-soundtrack-creator#create',
+    )
+
+    create.add_argument(
+        'input',
+        help = 'configuration json path',
+    )
+    
+    return create
+
+COMMAND_PARSERS = {
+    'tag': build_tag_parser,
+    'create': build_create_parser,
+}
+
+def run_tag(args: argparse.Namespace):
+    from .soundtrack import Soundtrack
+
+    soundtrack = Soundtrack(
+        args.input,
+        output=args.output,
+        album=args.album,
+        artist=args.artist,
+        title=args.title,
+        track=args.track,
+        band=args.band,
+        publisher=args.publisher,
+        genre=args.genre,
+        disc=args.disc,
+        cover_art=args.cover,
+        spreadsheet=args.spreadsheet,
+        clear=args.clear,
+    )
+
+    soundtrack.write_tags()
+    soundtrack.save()
+
+def run_create(args: argparse.Namespace):
+    from .maker import SoundtrackMaker
+
+    maker = SoundtrackMaker(args.input)
+    maker.create_soundtrack()
+
+COMMANDS = {
+    'tag': run_tag,
+    'create': run_create,
+}
+
+def build_parser(commands: typing.Iterable[str] = COMMAND_PARSERS) -> argparse.ArgumentParser:
+    """Build the argument parser.
+
+    Args:
+        commands (Iterable[str], optional): Subcommands to add to the parser. Defaults to all of them.
+
+    Returns:
+        argparse.ArgumentParser: argument parser
+    """
     arg_parser = argparse.ArgumentParser(
         description = 'Fill out all the metadata in a soundtrack with this program.',
         epilog = 'Any metadata values that are not included will not be removed or modified in the audio files.'
     )
-    
+
     arg_parser.add_argument(
         '--log_level', '-l',
         dest = 'log_level',
-        help = f'log level {{{", ".join(logging._nameToLevel.keys())}}}',
+        help = LOG_LEVEL_HELP,
         default = logging.INFO,
-        
+
     )
-    
+
     subparsers = arg_parser.add_subparsers(
         title = 'commands',
         dest = 'command',
+        required = True,
     )
     
-    tag = subparsers.add_parser(
-        'tag',
-        help = 'add metadata to a soundtrack',
-    )
-    
-    tag.add_argument(
-        'input',
-        help = 'input soundtrack folder',
-    )
-    
-    tag.add_argument(
-        '--output', '-o',
-        dest = 'output',
-        help = 'Output folder to put the soundtrack in. If ommitted, it will modify the original files.',
-    )
+    for command in commands:
+        COMMAND_PARSERS[command](subparsers)
     
-    tag.add_argument(
-        '--artist', '-ar',
-        dest = 'artist',
-        help = 'Artist or composer.',
-    )
-    
-    tag.add_argument(
-        '--title', '-ti',
-        dest = 'title',
-        help = 'Track title. This can be regex to get the title from the filename.',
-    )
-    
-    tag.add_argument(
-        '--track', '-tr',
-        dest = 'track',
-        help = 'Track number. This can be regex to get the track from the filename.',
-    )
-    
-    tag.add_argument(
-        '--band', '-b',
-        dest = 'band',
-        help = 'Album artist / band',
-    )
+    return arg_parser
 
-    tag.add_argument(
-        '--album', '-al',
-        dest = 'album',
-        help = 'Album title',
-    )
-    
-    tag.add_argument(
-        '--publisher', '-p',
-        dest = 'publisher',
-        help = 'Publisher',
-    )
-    
-    tag.add_argument(
-        '--genre', '-g',
-        dest = 'genre',
-        help = 'Genre(s)',
-        nargs = '*',
-    )
-    
-    tag.add_argument(
-        '--disc', '-d',
-        dest = 'disc',
-        help = 'Disc number. This can be regex to get the disc from the filename.',
-    )
-    
-    tag.add_argument(
-        '--cover', '-c',
-        dest = 'cover',
-        help = 'Cover art image.',
-    )
-    
-    tag.add_argument(
-        '--clear',
-        dest = 'clear',
-        help = 'Clear metadata before writing',
-        action = 'store_true',
-    )
-    
-    tag.add_argument(
-        '--spreadsheet', '-s',
-        dest = 'spreadsheet',
-        help = 'Add a metadata spreadsheet. This csv will have a header, and it will match the first column then add the specified metadata tags.',
-    )
-    
-    create = subparsers.add_parser(
-        'create',
-        help = 'Create and loop audio files in a soundtrack. More information can be found at https://github.com/ego-lay-atman-bay/python-soundtrack-creator#create',
+def parse_tag_args(argv: list[str]) -> argparse.Namespace | None:
+    """Parse the arguments after `tag` without building an `argparse` parser. This only understands the exact flags in `TAG_ARGUMENTS`, so anything else (help, abbreviations, `--flag=value`, etc.) makes it give up.
+
+    Args:
+        argv (list[str]): arguments after the `tag` command.
+
+    Returns:
+        argparse.Namespace | None: parsed arguments, or `None` if `argparse` needs to handle it.
+    """
+    args = argparse.Namespace(
+        log_level = logging.INFO,
+        command = 'tag',
+        input = None,
     )
+    options = {}
+
+    for flags, kwargs in TAG_ARGUMENTS:
+        if 'dest' not in kwargs:
+            continue
+        setattr(args, kwargs['dest'], False if kwargs.get('action') == 'store_true' else None)
+        for flag in flags:
+            options[flag] = kwargs
+
+    index = 0
+    while index < len(argv):
+        arg = argv[index]
+        index += 1
+
+        if not arg.startswith('-'):
+            if args.input is not None:
+                return
+            args.input = arg
+            continue
+
+        if arg not in options:
+            return
+
+        kwargs = options[arg]
+
+        if kwargs.get('action') == 'store_true':
+            setattr(args, kwargs['dest'], True)
+        elif kwargs.get('nargs') == '*':
+            values = []
+            while index < len(argv) and not argv[index].startswith('-'):
+                values.append(argv[index])
+                index += 1
+            setattr(args, kwargs['dest'], values)
+        else:
+            if index >= len(argv) or argv[index].startswith('-'):
+                return
+            setattr(args, kwargs['dest'], argv[index])
+            index += 1
+
+    if args.input is None:
+        return
+
+    return args
+
+def main():
+    if len(sys.argv) < 2:
+        arg_parser = build_parser()
+        arg_parser.print_help()
+        arg_parser.exit(0)
     
-    create.add_argument(
-        'input',
-        help = 'configuration json path',
-    )
+    args = None
     
-    if len(sys.argv[1:]) < 1:
-        arg_parser.print_help()
-        sys.exit()
+    # the tag command is simple enough to parse without argparse
+    if sys.argv[1] == 'tag':
+        args = parse_tag_args(sys.argv[2:])
     
-    args = arg_parser.parse_args()
+    if args is None:
+        # only build the subcommand that's actually being run
+        if sys.argv[1] in COMMAND_PARSERS:
+            arg_parser = build_parser([sys.argv[1]])
+        else:
+            arg_parser = build_parser()
+        
+        args = arg_parser.parse_args()
     
     setup_logger(args.log_level)
 
-    if args.command == 'tag':
-        soundtrack = Soundtrack(
-            args.input,
-            output=args.output,
-            album=args.album,
-            artist=args.artist,
-            title=args.title,
-            track=args.track,
-            band=args.band,
-            publisher=args.publisher,
-            genre=args.genre,
-            disc=args.disc,
-            cover_art=args.cover,
-            spreadsheet=args.spreadsheet,
-            clear=args.clear,
-        )
-
-        soundtrack.write_tags()
-        soundtrack.save()
-    elif args.command == 'create':
-        maker = SoundtrackMaker(args.input)
-        maker.create_soundtrack()
+    COMMANDS[args.command](args)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,6 @@
 import logging
 import io
-import filetype
+import functools
 # import mimetypes # I'm gonna look into this
 import base64
 from mutagen import id3, flac, _vorbis, FileType
@@ -9,184 +9,7 @@ import typing
 from typing import Literal, Type
 from PIL import Image
 
-ID3_FRAMES: dict[str, Type[id3._frames.Frame]] = {
-    "AENC": id3.AENC,
-    "APIC": id3.APIC,
-    "ASPI": id3.ASPI,
-    "BUF": id3.BUF,
-    "CHAP": id3.CHAP,
-    "CNT": id3.CNT,
-    "COM": id3.COM,
-    "COMM": id3.COMM,
-    "COMR": id3.COMR,
-    "CRA": id3.CRA,
-    "CRM": id3.CRM,
-    "CTOC": id3.CTOC,
-    "ENCR": id3.ENCR,
-    "EQU2": id3.EQU2,
-    "ETC": id3.ETC,
-    "ETCO": id3.ETCO,
-    "GEO": id3.GEO,
-    "GEOB": id3.GEOB,
-    "GP1": id3.GP1,
-    "GRID": id3.GRID,
-    "GRP1": id3.GRP1,
-    "IPL": id3.IPL,
-    "IPLS": id3.IPLS,
-    "LINK": id3.LINK,
-    "LNK": id3.LNK,
-    "MCDI": id3.MCDI,
-    "MCI": id3.MCI,
-    "MLL": id3.MLL,
-    "MLLT": id3.MLLT,
-    "MVI": id3.MVI,
-    "MVIN": id3.MVIN,
-    "MVN": id3.MVN,
-    "MVNM": id3.MVNM,
-    "OWNE": id3.OWNE,
-    "PCNT": id3.PCNT,
-    "PCST": id3.PCST,
-    "PIC": id3.PIC,
-    "POP": id3.POP,
-    "POPM": id3.POPM,
-    "POSS": id3.POSS,
-    "PRIV": id3.PRIV,
-    "RBUF": id3.RBUF,
-    "REV": id3.REV,
-    "RVA": id3.RVA,
-    "RVA2": id3.RVA2,
-    "RVAD": id3.RVAD,
-    "RVRB": id3.RVRB,
-    "SEEK": id3.SEEK,
-    "SIGN": id3.SIGN,
-    "SLT": id3.SLT,
-    "STC": id3.STC,
-    "SYLT": id3.SYLT,
-    "SYTC": id3.SYTC,
-    "TAL": id3.TAL,
-    "TALB": id3.TALB,
-    "TBP": id3.TBP,
-    "TBPM": id3.TBPM,
-    "TCAT": id3.TCAT,
-    "TCM": id3.TCM,
-    "TCMP": id3.TCMP,
-    "TCO": id3.TCO,
-    "TCOM": id3.TCOM,
-    "TCON": id3.TCON,
-    "TCOP": id3.TCOP,
-    "TCP": id3.TCP,
-    "TCR": id3.TCR,
-    "TDA": id3.TDA,
-    "TDAT": id3.TDAT,
-    "TDEN": id3.TDEN,
-    "TDES": id3.TDES,
-    "TDLY": id3.TDLY,
-    "TDOR": id3.TDOR,
-    "TDRC": id3.TDRC,
-    "TDRL": id3.TDRL,
-    "TDTG": id3.TDTG,
-    "TDY": id3.TDY,
-    "TEN": id3.TEN,
-    "TENC": id3.TENC,
-    "TEXT": id3.TEXT,
-    "TFLT": id3.TFLT,
-    "TFT": id3.TFT,
-    "TGID": id3.TGID,
-    "TIM": id3.TIM,
-    "TIME": id3.TIME,
-    "TIPL": id3.TIPL,
-    "TIT1": id3.TIT1,
-    "TIT2": id3.TIT2,
-    "TIT3": id3.TIT3,
-    "TKE": id3.TKE,
-    "TKEY": id3.TKEY,
-    "TKWD": id3.TKWD,
-    "TLA": id3.TLA,
-    "TLAN": id3.TLAN,
-    "TLE": id3.TLE,
-    "TLEN": id3.TLEN,
-    "TMCL": id3.TMCL,
-    "TMED": id3.TMED,
-    "TMOO": id3.TMOO,
-    "TMT": id3.TMT,
-    "TOA": id3.TOA,
-    "TOAL": id3.TOAL,
-    "TOF": id3.TOF,
-    "TOFN": id3.TOFN,
-    "TOL": id3.TOL,
-    "TOLY": id3.TOLY,
-    "TOPE": id3.TOPE,
-    "TOR": id3.TOR,
-    "TORY": id3.TORY,
-    "TOT": id3.TOT,
-    "TOWN": id3.TOWN,
-    "TP1": id3.TP1,
-    "TP2": id3.TP2,
-    "TP3": id3.TP3,
-    "TP4": id3.TP4,
-    "TPA": id3.TPA,
-    "TPB": id3.TPB,
-    "TPE1": id3.TPE1,
-    "TPE2": id3.TPE2,
-    "TPE3": id3.TPE3,
-    "TPE4": id3.TPE4,
-    "TPOS": id3.TPOS,
-    "TPRO": id3.TPRO,
-    "TPUB": id3.TPUB,
-    "TRC": id3.TRC,
-    "TRCK": id3.TRCK,
-    "TRD": id3.TRD,
-    "TRDA": id3.TRDA,
-    "TRK": id3.TRK,
-    "TRSN": id3.TRSN,
-    "TRSO": id3.TRSO,
-    "TS2": id3.TS2,
-    "TSA": id3.TSA,
-    "TSC": id3.TSC,
-    "TSI": id3.TSI,
-    "TSIZ": id3.TSIZ,
-    "TSO2": id3.TSO2,
-    "TSOA": id3.TSOA,
-    "TSOC": id3.TSOC,
-    "TSOP": id3.TSOP,
-    "TSOT": id3.TSOT,
-    "TSP": id3.TSP,
-    "TSRC": id3.TSRC,
-    "TSS": id3.TSS,
-    "TSSE": id3.TSSE,
-    "TSST": id3.TSST,
-    "TST": id3.TST,
-    "TT1": id3.TT1,
-    "TT2": id3.TT2,
-    "TT3": id3.TT3,
-    "TXT": id3.TXT,
-    "TXX": id3.TXX,
-    "TXXX": id3.TXXX,
-    "TYE": id3.TYE,
-    "TYER": id3.TYER,
-    "UFI": id3.UFI,
-    "UFID": id3.UFID,
-    "ULT": id3.ULT,
-    "USER": id3.USER,
-    "USLT": id3.USLT,
-    "WAF": id3.WAF,
-    "WAR": id3.WAR,
-    "WAS": id3.WAS,
-    "WCM": id3.WCM,
-    "WCOM": id3.WCOM,
-    "WCOP": id3.WCOP,
-    "WCP": id3.WCP,
-    "WFED": id3.WFED,
-    "WOAF": id3.WOAF,
-    "WOAR": id3.WOAR,
-    "WOAS": id3.WOAS,
-    "WORS": id3.WORS,
-    "WPAY": id3.WPAY,
-    "WPB": id3.WPB,
-    "WPUB": id3.WPUB,
-    "WXX": id3.WXX,
-    "WXXX": id3.WXXX,
-}
+ID3_FRAMES: dict[str, Type[id3._frames.Frame]] = {**id3.Frames, **id3.Frames_2_2}
 
 TAGS: list[
     dict[
@@ -384,11 +207,38 @@ TAGS: list[
     {"name": ["toc", "tableofcontents"], "id3": "CTOC", "vorbis": "tableofcontents"},
 ]
 
+def _split_tag_id(tag_id: str | dict) -> tuple[str, str]:
+    if isinstance(tag_id, dict):
+        tag_id = tag_id["id"]
+    split = tag_id.split(":")
+    return split[0].lower(), split[1] if len(split) > 1 else ""
+
+# lookup tables so finding a tag doesn't have to scan all of TAGS
+_TAG_NAME_INDEX: dict[str, int] = {}
+_TAG_ID_INDEX: dict[str, dict[tuple[str, str], int]] = {"id3": {}, "vorbis": {}}
+_TAG_ID_FALLBACK_INDEX: dict[str, dict[str, int]] = {"id3": {}, "vorbis": {}}
+_TAG_NAMES_ID_INDEX: dict[tuple[str, str], int] = {}
+_TAG_NAMES_FALLBACK_INDEX: dict[str, int] = {}
+
+for _index, _tag_info in enumerate(TAGS):
+    for _name in _tag_info["name"]:
+        _TAG_NAME_INDEX.setdefault(_name, _index)
+
+    for _type in ["id3", "vorbis"]:
+        _tag_id, _tag_desc = _split_tag_id(_tag_info[_type])
+        _TAG_ID_INDEX[_type].setdefault((_tag_id, _tag_desc.lower()), _index)
+        _TAG_ID_FALLBACK_INDEX[_type][_tag_id] = _index
+        _TAG_NAMES_ID_INDEX.setdefault((_tag_id, _tag_desc), _index)
+        _TAG_NAMES_FALLBACK_INDEX[_tag_id] = _index
+
+del _index, _tag_info, _name, _type, _tag_id, _tag_desc
+
 __all__ = [
     "TAGS",
     "ID3_FRAMES",
     "get_tag",
     "set_tag",
+    "set_tags",
     "remove_tag",
     "set_picture",
     "get_tag_names",
@@ -401,7 +251,7 @@ def get_tag(audio: FileType, tag: str):
     if not isinstance(audio, FileType):
         raise TypeError("not mutagen audio object")
 
-    if audio.tags == None:
+    if audio.tags is None:
         return
 
     if isinstance(audio.tags, id3.ID3):
@@ -416,7 +266,7 @@ def set_tag(audio: FileType, tag: str, value: str, **kwargs):
     if not isinstance(audio, FileType):
         raise TypeError("not mutagen audio object")
 
-    if audio.tags == None:
+    if audio.tags is None:
         return
 
     if isinstance(audio.tags, id3.ID3):
@@ -426,11 +276,36 @@ def set_tag(audio: FileType, tag: str, value: str, **kwargs):
 
     raise NotImplementedError("audio type not supported")
 
+
+def set_tags(audio: FileType, tags: dict[str, typing.Any]):
+    """Set multiple tags at once. This only checks the audio type once, instead of once per tag like `set_tag`.
+
+    Args:
+        audio (FileType): mutagen audio object
+        tags (dict[str, Any]): tag names and their values
+    """
+    if not isinstance(audio, FileType):
+        raise TypeError("not mutagen audio object")
+
+    if audio.tags is None:
+        return
+
+    if isinstance(audio.tags, id3.ID3):
+        for tag, value in tags.items():
+            _set_id3_tag(audio.tags, tag, value=value)
+        return
+    elif isinstance(audio.tags, _vorbis.VCommentDict):
+        for tag, value in tags.items():
+            _set_vorbis_tag(audio.tags, tag, value=value)
+        return
+
+    raise NotImplementedError("audio type not supported")
+
 def get_picture(audio: FileType):
     if not isinstance(audio, FileType):
         raise TypeError("not mutagen audio object")
 
-    if audio.tags == None:
+    if audio.tags is None:
         return
     
     if isinstance(audio.tags, id3.ID3):
@@ -460,7 +335,7 @@ def _get_flac_picture(audio: flac.FLAC):
 def _get_vorbis_picture(tags: _vorbis.VCommentDict):
     base64_data = _get_vorbis_tag(tags, 'picture')
 
-    if base64_data == None:
+    if base64_data is None:
         return
     
     picture_data = base64.b64decode(base64_data)
@@ -475,47 +350,67 @@ def set_picture(audio: FileType, image: str | bytes | io.BytesIO | Image.Image):
     if not isinstance(audio, FileType):
         raise TypeError("not mutagen audio object")
 
-    if audio.tags == None:
+    if audio.tags is None:
         return
     
-    if isinstance(image, str):
-        picture = Image.open(image)
-    elif isinstance(image, bytes):
-        data = io.BytesIO(image)
-        data.seek(0)
-        picture = Image.open(data)
-    elif isinstance(image, Image.Image):
-        picture = image.copy()
-    elif hasattr(image, 'read') and hasattr(image, 'seek') and hasattr(image, 'call'):
-        image.seek(0)
-        picture = Image.open(image)
-    elif image == None:
-        picture = image
-    else:
-        raise TypeError('not a valid image')
+    # keep the original file data, so jpegs can be embedded without decoding them
+    data = None
+    
+    match image:
+        case str():
+            with open(image, 'rb') as file:
+                data = file.read()
+            picture = Image.open(io.BytesIO(data))
+        case bytes():
+            data = image
+            picture = Image.open(io.BytesIO(image))
+        case Image.Image():
+            # the image only gets saved into a new buffer, so it doesn't need to be copied
+            picture = image
+        case None:
+            picture = None
+        case _ if hasattr(image, 'read') and hasattr(image, 'seek'):
+            image.seek(0)
+            data = image.read()
+            picture = Image.open(io.BytesIO(data))
+        case _:
+            raise TypeError('not a valid image')
     
     if isinstance(audio.tags, id3.ID3):
-        return _set_id3_picture(audio.tags, picture)
+        return _set_id3_picture(audio.tags, picture, data)
     elif isinstance(audio.tags, flac.VCFLACDict):
-        return _set_flac_picture(audio, picture)
+        return _set_flac_picture(audio, picture, data)
     elif isinstance(audio.tags, _vorbis.VCommentDict):
-        return _set_vorbis_picture(audio.tags, picture)
+        return _set_vorbis_picture(audio.tags, picture, data)
 
     raise NotImplementedError("audio type not supported")
 
-def _set_id3_picture(tags: id3.ID3, image: Image.Image):
-    _remove_id3_tag(tags, 'picture')
-    
-    if image == None:
-        return
+def _encode_picture(image: Image.Image, data: bytes | None = None) -> bytes:
+    """Encode an image as a jpeg for embedding as cover art.
+
+    Args:
+        image (Image.Image): cover art image
+        data (bytes | None, optional): original file data `image` was opened from. Defaults to None.
+
+    Returns:
+        bytes: jpeg data
+    """
+    # a jpeg is already in the right format, and Image.open hasn't decoded it yet
+    if data is not None and image.format == 'JPEG':
+        return data
     
     picture = io.BytesIO()
     image.save(picture, format = 'JPEG')
+    return picture.getvalue()
+
+def _set_id3_picture(tags: id3.ID3, image: Image.Image, data: bytes | None = None):
+    _remove_id3_tag(tags, 'picture')
     
-    picture.seek(0)
+    if image is None:
+        return
     
-    data = picture.getvalue()
-    mime = filetype.guess(data).mime
+    data = _encode_picture(image, data)
+    mime = 'image/jpeg'
     
     _set_id3_tag(
         tags,
@@ -527,19 +422,14 @@ def _set_id3_picture(tags: id3.ID3, image: Image.Image):
         data = data,
     )
 
-def _set_flac_picture(audio: FileType, image: Image.Image):
+def _set_flac_picture(audio: FileType, image: Image.Image, data: bytes | None = None):
     audio.clear_pictures()
     
-    if image == None:
+    if image is None:
         return
     
-    picture = io.BytesIO()
-    image.save(picture, format = 'JPEG')
-    
-    picture.seek(0)
-    
-    data = picture.getvalue()
-    mime = filetype.guess(data).mime
+    data = _encode_picture(image, data)
+    mime = 'image/jpeg'
 
     picture = Picture()
     picture.data = data
@@ -550,17 +440,12 @@ def _set_flac_picture(audio: FileType, image: Image.Image):
 
     audio.add_picture(picture)
 
-def _set_vorbis_picture(tags: _vorbis.VCommentDict, image: Image.Image):
-    if image == None:
+def _set_vorbis_picture(tags: _vorbis.VCommentDict, image: Image.Image, data: bytes | None = None):
+    if image is None:
         return
     
-    picture = io.BytesIO()
-    image.save(picture, format = 'JPEG')
-    
-    picture.seek(0)
-    
-    data = picture.getvalue()
-    mime = filetype.guess(data).mime
+    data = _encode_picture(image, data)
+    mime = 'image/jpeg'
 
     picture = Picture()
     picture.data = data
@@ -579,7 +464,7 @@ def remove_tag(audio: FileType, tag: str):
     if not isinstance(audio, FileType):
         raise TypeError("not mutagen audio object")
 
-    if audio.tags == None:
+    if audio.tags is None:
         return
 
     if isinstance(audio.tags, id3.ID3):
@@ -590,38 +475,31 @@ def remove_tag(audio: FileType, tag: str):
     raise NotImplementedError("audio type not supported")
 
 
+@functools.lru_cache(maxsize = 1024)
 def get_tag_info(type: Literal["id3", "vorbis"], tag: str):
     split = tag.split(":")
     desc = split[1] if len(split) > 1 else ""
 
     tag = split[0]
+    lower = tag.lower()
 
-    result = ""
-
-    for tag_info in TAGS:
-        if tag.lower() in tag_info["name"]:
-            return tag_info[type]
-        tag_id = tag_info[type]
-        if isinstance(tag_id, dict):
-            tag_id = tag_id["id"]
-
-        if tag_id == None:
-            continue
-
-        split = tag_id.split(":")
-
-        tag_id = split[0]
-        tag_desc = split[1] if len(split) > 1 else ""
-
-        if tag.lower() == tag_id.lower():
-            if tag_desc.lower() == desc.lower():
-                return tag_info[type]
+    # the first entry that matches either by name or by id and description wins
+    index = min(
+        _TAG_NAME_INDEX.get(lower, len(TAGS)),
+        _TAG_ID_INDEX[type].get((lower, desc.lower()), len(TAGS)),
+    )
+    if index < len(TAGS):
+        return TAGS[index][type]
 
-            result = tag_info[type]
+    # otherwise fall back to the last entry with a matching id
+    index = _TAG_ID_FALLBACK_INDEX[type].get(lower)
+    if index is not None:
+        return TAGS[index][type]
 
-    return result if result else tag
+    return tag
 
 
+@functools.lru_cache(maxsize = 1024)
 def get_tag_id(type: Literal["id3", "vorbis"], tag: str):
     id = get_tag_info(type, tag)
     if isinstance(id, dict):
@@ -632,47 +510,26 @@ def get_tag_names(tag: str) -> list[str]:
     split = tag.split(':')
     tag = split[0]
     desc = split[1] if len(split) > 1 else ''
+    lower = tag.lower()
     
-    for tag_info in TAGS:
-        if tag.lower() in tag_info["name"]:
-            return tag_info["name"]
-        
-        result = ''
-        
-        for type in ['id3', "vorbis"]:
-            tag_name = tag_info[type]
-            
-            if isinstance(tag_name, dict):
-                tag_name = tag_name['id']
-                
-            if tag_name == None:
-                continue
-                
-            split = tag_name.split(':')
-            tag_name = split[0]
-            tag_desc = split[1] if len(split) > 1 else ''
-            
-        
-            if tag.lower() == tag_name.lower():
-#                 print(f"""tag: {tag}
-# desc: {desc}
-# tag_name: {tag_name}
-# tag_desc: {tag_desc}
-# """)
-                if desc == tag_desc:
-                    # print(f'name: {tag_info["name"]}')
-                    return tag_info["name"]
-
-                result = tag_info["name"]
+    index = min(
+        _TAG_NAME_INDEX.get(lower, len(TAGS)),
+        _TAG_NAMES_ID_INDEX.get((lower, desc), len(TAGS)),
+    )
+    if index < len(TAGS):
+        return TAGS[index]["name"]
     
-    # print(f'result: {result}')
-    if tag.lower() == 'txxx':
-        # print(f'desc: {desc}')
+    if lower == 'txxx':
         if desc:
             return desc
+    
+    index = _TAG_NAMES_FALLBACK_INDEX.get(lower)
+    if index is not None:
+        return TAGS[index]["name"]
         
-    return result if result else tag
+    return tag
 
+@functools.lru_cache(maxsize = 1024)
 def get_tag_name(tag: str):
     name = get_tag_names(tag)
     if isinstance(name, list):
@@ -724,7 +581,7 @@ def _set_id3_tag(tags: id3.ID3, tag: str, value: str = None, **kwargs):
     if isinstance(info, dict):
         id = info["id"]
 
-        if value != None:
+        if value is not None:
             if "default" in info:
                 if info["default"] not in kwargs:
                     kwargs[info["default"]] = value
@@ -750,10 +607,10 @@ def _set_id3_tag(tags: id3.ID3, tag: str, value: str = None, **kwargs):
         desc = id
         id = f"TXXX"
 
-    if "desc" in kwargs and desc != None:
+    if "desc" in kwargs and desc is not None:
         desc = f'{desc}:{kwargs["desc"]}'
 
-    if desc != None:
+    if desc is not None:
         kwargs["desc"] = desc
 
     frame = ID3_FRAMES[id]
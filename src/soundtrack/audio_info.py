@@ -1,133 +1,131 @@
 import mutagen
-from mutagen import flac, id3, wave
+from mutagen import flac, id3, mp3, wave
 from PIL import Image
 from filetype import filetype
 
 
+import concurrent.futures
+import functools
 import io
+import types
 import typing
 
-
-class AudioInfo:
-    ID3_TAGS: dict[
-        str, dict[typing.Literal["tag", "class", "desc"], typing.Type[id3.Frame] | str]
-    ] = {
-        "Picture": {"tag": "APIC", "class": id3.APIC},
-        "Cover": {"tag": "APIC", "class": id3.APIC},
-        "Artwork": {"tag": "APIC", "class": id3.APIC},
-        "Comment": {"tag": "COMM", "class": id3.COMM},
-        "Grouping": {"tag": "GRP1", "class": id3.GRP1},
-        "InvolvedPeople": {"tag": "IPLS", "class": id3.IPLS},
-        "MusicCDIdentifier": {"tag": "MCDI", "class": id3.MCDI},
-        "MovementNumber": {"tag": "MVIN", "class": id3.MVIN},
-        "MovementName": {"tag": "MVNM", "class": id3.MVNM},
-        "Ownership": {"tag": "OWNE", "class": id3.OWNE},
-        "PlayCounter": {"tag": "PCNT", "class": id3.PCNT},
-        "Podcast?": {"tag": "PCST", "class": id3.PCST},
-        "Podcast": {"tag": "PCST", "class": id3.PCST},
-        "Popularimeter": {"tag": "POPM", "class": id3.POPM},
-        "Private": {"tag": "PRIV", "class": id3.PRIV},
-        "SynLyrics": {"tag": "SYLT", "class": id3.SYLT},
-        "Album": {"tag": "TALB", "class": id3.TALB},
-        "BeatsPerMinute": {"tag": "TBPM", "class": id3.TBPM},
-        "BPM": {"tag": "TBPM", "class": id3.TBPM},
-        "PodcastCategory": {"tag": "TCAT", "class": id3.TCAT},
-        "Compilation": {"tag": "TCMP", "class": id3.TCMP},
-        "Composer": {"tag": "TCOM", "class": id3.TCOM},
-        "Genre": {"tag": "TCON", "class": id3.TCON},
-        "Copyright": {"tag": "TCOP", "class": id3.TCOP},
-        "Date": {"tag": "TDAT", "class": id3.TDAT},
-        "Year": {"tag": "TDRC", "class": id3.TDRC},
-        "PodcastDescription": {"tag": "TDES", "class": id3.TDES},
-        "PlaylistDelay": {"tag": "TDLY", "class": id3.TDLY},
-        "EncodedBy": {"tag": "TENC", "class": id3.TENC},
-        "Lyricist": {"tag": "TEXT", "class": id3.TEXT},
-        "FileType": {"tag": "TFLT", "class": id3.TFLT},
-        "PodcastID": {"tag": "TGID", "class": id3.TGID},
-        "Time": {"tag": "TIME", "class": id3.TIME},
-        "Grouping": {"tag": "TIT1", "class": id3.TIT1},
-        "Title": {"tag": "TIT2", "class": id3.TIT2},
-        "Subtitle": {"tag": "TIT3", "class": id3.TIT3},
-        "InitialKey": {"tag": "TKEY", "class": id3.TKEY},
-        "PodcastKeywords": {"tag": "TKWD", "class": id3.TKWD},
-        "Language": {"tag": "TLAN", "class": id3.TLAN},
-        "Length": {"tag": "TLEN", "class": id3.TLEN},
-        "Media": {"tag": "TMED", "class": id3.TMED},
-        "OriginalAlbum": {"tag": "TOAL", "class": id3.TOAL},
-        "OriginalFileName": {"tag": "TOFN", "class": id3.TOFN},
-        "OriginalLyricist": {"tag": "TOLY", "class": id3.TOLY},
-        "OriginalArtist": {"tag": "TOPE", "class": id3.TOPE},
-        "OriginalReleaseYear": {"tag": "TORY", "class": id3.TORY},
-        "FileOwner": {"tag": "TOWN", "class": id3.TOWN},
-        "Artist": {"tag": "TPE1", "class": id3.TPE1},
-        "Band": {"tag": "TPE2", "class": id3.TPE2},
-        "Conductor": {"tag": "TPE3", "class": id3.TPE3},
-        "InterpretedBy": {"tag": "TPE4", "class": id3.TPE4},
-        "PartOfSet": {"tag": "TPOS", "class": id3.TPOS},
-        "disk": {"tag": "TPOS", "class": id3.TPOS},
-        "disc": {"tag": "TPOS", "class": id3.TPOS},
-        "cd": {"tag": "TPOS", "class": id3.TPOS},
-        "Publisher": {"tag": "TPUB", "class": id3.TPUB},
-        "Track": {"tag": "TRCK", "class": id3.TRCK},
-        "RecordingDates": {"tag": "TRDA", "class": id3.TRDA},
-        "InternetRadioStationName": {"tag": "TRSN", "class": id3.TRSN},
-        "InternetRadioStationOwner": {"tag": "TRSO", "class": id3.TRSO},
-        "Size": {"tag": "TSIZ", "class": id3.TSIZ},
-        "AlbumArtistSortOrder": {"tag": "TSO2", "class": id3.TSO2},
-        "ComposerSortOrder": {"tag": "TSOC", "class": id3.TSOC},
-        "ISRC": {"tag": "TSRC", "class": id3.TSRC},
-        "EncoderSettings": {"tag": "TSSE", "class": id3.TSSE},
-        "UserDefinedText": {"tag": "TXXX", "class": id3.TXXX},
-        "Year": {"tag": "TYER", "class": id3.TYER},
-        "TermsOfUse": {"tag": "USER", "class": id3.USER},
-        "Lyrics": {"tag": "USLT", "class": id3.USLT},
-        "CommercialURL": {"tag": "WCOM", "class": id3.WCOM},
-        "CopyrightURL": {"tag": "WCOP", "class": id3.WCOP},
-        "PodcastURL": {"tag": "WFED", "class": id3.WFED},
-        "FileURL": {"tag": "WOAF", "class": id3.WOAF},
-        "ArtistURL": {"tag": "WOAR", "class": id3.WOAR},
-        "SourceURL": {"tag": "WOAS", "class": id3.WOAS},
-        "InternetRadioStationURL": {"tag": "WORS", "class": id3.WORS},
-        "PaymentURL": {"tag": "WPAY", "class": id3.WPAY},
-        "PublisherURL": {"tag": "WPUB", "class": id3.WPUB},
-        "UserDefinedURL": {"tag": "WXXX", "class": id3.WXXX},
-        "TXXX": {"tag": "TXXX", "class": id3.TXXX},
-        "totaldiscs": {"tag": "TXXX", "class": id3.TXXX, "desc": "TOTALDISCS"},
-        "totaldisks": {"tag": "TXXX", "class": id3.TXXX, "desc": "TOTALDISCS"},
-        "discs": {"tag": "TXXX", "class": id3.TXXX, "desc": "TOTALDISCS"},
-        "disks": {"tag": "TXXX", "class": id3.TXXX, "desc": "TOTALDISCS"},
-        "totaltracks": {"tag": "TXXX", "class": id3.TXXX, "desc": "TOTALTRACKS"},
-        "tracks": {"tag": "TXXX", "class": id3.TXXX, "desc": "TOTALTRACKS"},
-        "encoder settings": {
-            "tag": "TXXX",
-            "class": id3.TXXX,
-            "desc": "ENCODER SETTINGS",
-        },
-        "accurateripdiscid": {
-            "tag": "TXXX",
-            "class": id3.TXXX,
-            "desc": "ACCURATERIPRESULT",
-            "desc": "ACCURATERIPDISCID",
-        },
-        "source": {"tag": "TXXX", "class": id3.TXXX, "desc": "SOURCE"},
-        "source": {"tag": "TXXX", "class": id3.TXXX, "desc": "SOURCE"},
-        "encoded by": {"tag": "TXXX", "class": id3.TXXX, "desc": "ENCODED BY"},
-        "encoder": {"tag": "TXXX", "class": id3.TXXX, "desc": "ENCODED BY"},
-        "encoder settings": {
-            "tag": "TXXX",
-            "class": id3.TXXX,
-            "desc": "ENCODER SETTINGS",
-        },
-        "encoder settings": {
-            "tag": "TXXX",
-            "class": id3.TXXX,
-            "desc": "ENCODER SETTINGS",
-        },
-    }
-
-    ID3_TAGS = {k.lower(): v for k, v in ID3_TAGS.items()}
-
-    FLAC_TAGS: dict[str, str] = {
+from .format import _FLOAT_RE
+
+
+_ID3_TAG_NAMES: dict[
+    str, dict[typing.Literal["tag", "class", "desc"], typing.Type[id3.Frame] | str]
+] = {
+    "Picture": {"tag": "APIC", "class": id3.APIC},
+    "Cover": {"tag": "APIC", "class": id3.APIC},
+    "Artwork": {"tag": "APIC", "class": id3.APIC},
+    "Comment": {"tag": "COMM", "class": id3.COMM},
+    "InvolvedPeople": {"tag": "IPLS", "class": id3.IPLS},
+    "MusicCDIdentifier": {"tag": "MCDI", "class": id3.MCDI},
+    "MovementNumber": {"tag": "MVIN", "class": id3.MVIN},
+    "MovementName": {"tag": "MVNM", "class": id3.MVNM},
+    "Ownership": {"tag": "OWNE", "class": id3.OWNE},
+    "PlayCounter": {"tag": "PCNT", "class": id3.PCNT},
+    "Podcast?": {"tag": "PCST", "class": id3.PCST},
+    "Podcast": {"tag": "PCST", "class": id3.PCST},
+    "Popularimeter": {"tag": "POPM", "class": id3.POPM},
+    "Private": {"tag": "PRIV", "class": id3.PRIV},
+    "SynLyrics": {"tag": "SYLT", "class": id3.SYLT},
+    "Album": {"tag": "TALB", "class": id3.TALB},
+    "BeatsPerMinute": {"tag": "TBPM", "class": id3.TBPM},
+    "BPM": {"tag": "TBPM", "class": id3.TBPM},
+    "PodcastCategory": {"tag": "TCAT", "class": id3.TCAT},
+    "Compilation": {"tag": "TCMP", "class": id3.TCMP},
+    "Composer": {"tag": "TCOM", "class": id3.TCOM},
+    "Genre": {"tag": "TCON", "class": id3.TCON},
+    "Copyright": {"tag": "TCOP", "class": id3.TCOP},
+    "Date": {"tag": "TDAT", "class": id3.TDAT},
+    "PodcastDescription": {"tag": "TDES", "class": id3.TDES},
+    "PlaylistDelay": {"tag": "TDLY", "class": id3.TDLY},
+    "EncodedBy": {"tag": "TENC", "class": id3.TENC},
+    "Lyricist": {"tag": "TEXT", "class": id3.TEXT},
+    "FileType": {"tag": "TFLT", "class": id3.TFLT},
+    "PodcastID": {"tag": "TGID", "class": id3.TGID},
+    "Time": {"tag": "TIME", "class": id3.TIME},
+    "Grouping": {"tag": "TIT1", "class": id3.TIT1},
+    "Title": {"tag": "TIT2", "class": id3.TIT2},
+    "Subtitle": {"tag": "TIT3", "class": id3.TIT3},
+    "InitialKey": {"tag": "TKEY", "class": id3.TKEY},
+    "PodcastKeywords": {"tag": "TKWD", "class": id3.TKWD},
+    "Language": {"tag": "TLAN", "class": id3.TLAN},
+    "Length": {"tag": "TLEN", "class": id3.TLEN},
+    "Media": {"tag": "TMED", "class": id3.TMED},
+    "OriginalAlbum": {"tag": "TOAL", "class": id3.TOAL},
+    "OriginalFileName": {"tag": "TOFN", "class": id3.TOFN},
+    "OriginalLyricist": {"tag": "TOLY", "class": id3.TOLY},
+    "OriginalArtist": {"tag": "TOPE", "class": id3.TOPE},
+    "OriginalReleaseYear": {"tag": "TORY", "class": id3.TORY},
+    "FileOwner": {"tag": "TOWN", "class": id3.TOWN},
+    "Artist": {"tag": "TPE1", "class": id3.TPE1},
+    "Band": {"tag": "TPE2", "class": id3.TPE2},
+    "Conductor": {"tag": "TPE3", "class": id3.TPE3},
+    "InterpretedBy": {"tag": "TPE4", "class": id3.TPE4},
+    "PartOfSet": {"tag": "TPOS", "class": id3.TPOS},
+    "disk": {"tag": "TPOS", "class": id3.TPOS},
+    "disc": {"tag": "TPOS", "class": id3.TPOS},
+    "cd": {"tag": "TPOS", "class": id3.TPOS},
+    "Publisher": {"tag": "TPUB", "class": id3.TPUB},
+    "Track": {"tag": "TRCK", "class": id3.TRCK},
+    "RecordingDates": {"tag": "TRDA", "class": id3.TRDA},
+    "InternetRadioStationName": {"tag": "TRSN", "class": id3.TRSN},
+    "InternetRadioStationOwner": {"tag": "TRSO", "class": id3.TRSO},
+    "Size": {"tag": "TSIZ", "class": id3.TSIZ},
+    "AlbumArtistSortOrder": {"tag": "TSO2", "class": id3.TSO2},
+    "ComposerSortOrder": {"tag": "TSOC", "class": id3.TSOC},
+    "ISRC": {"tag": "TSRC", "class": id3.TSRC},
+    "EncoderSettings": {"tag": "TSSE", "class": id3.TSSE},
+    "UserDefinedText": {"tag": "TXXX", "class": id3.TXXX},
+    "Year": {"tag": "TYER", "class": id3.TYER},
+    "TermsOfUse": {"tag": "USER", "class": id3.USER},
+    "Lyrics": {"tag": "USLT", "class": id3.USLT},
+    "CommercialURL": {"tag": "WCOM", "class": id3.WCOM},
+    "CopyrightURL": {"tag": "WCOP", "class": id3.WCOP},
+    "PodcastURL": {"tag": "WFED", "class": id3.WFED},
+    "FileURL": {"tag": "WOAF", "class": id3.WOAF},
+    "ArtistURL": {"tag": "WOAR", "class": id3.WOAR},
+    "SourceURL": {"tag": "WOAS", "class": id3.WOAS},
+    "InternetRadioStationURL": {"tag": "WORS", "class": id3.WORS},
+    "PaymentURL": {"tag": "WPAY", "class": id3.WPAY},
+    "PublisherURL": {"tag": "WPUB", "class": id3.WPUB},
+    "UserDefinedURL": {"tag": "WXXX", "class": id3.WXXX},
+    "TXXX": {"tag": "TXXX", "class": id3.TXXX},
+    "totaldiscs": {"tag": "TXXX", "class": id3.TXXX, "desc": "TOTALDISCS"},
+    "totaldisks": {"tag": "TXXX", "class": id3.TXXX, "desc": "TOTALDISCS"},
+    "discs": {"tag": "TXXX", "class": id3.TXXX, "desc": "TOTALDISCS"},
+    "disks": {"tag": "TXXX", "class": id3.TXXX, "desc": "TOTALDISCS"},
+    "totaltracks": {"tag": "TXXX", "class": id3.TXXX, "desc": "TOTALTRACKS"},
+    "tracks": {"tag": "TXXX", "class": id3.TXXX, "desc": "TOTALTRACKS"},
+    "encoder settings": {
+        "tag": "TXXX",
+        "class": id3.TXXX,
+        "desc": "ENCODER SETTINGS",
+    },
+    "accurateripdiscid": {
+        "tag": "TXXX",
+        "class": id3.TXXX,
+        "desc": "ACCURATERIPDISCID",
+    },
+    "source": {"tag": "TXXX", "class": id3.TXXX, "desc": "SOURCE"},
+    "encoded by": {"tag": "TXXX", "class": id3.TXXX, "desc": "ENCODED BY"},
+    "encoder": {"tag": "TXXX", "class": id3.TXXX, "desc": "ENCODED BY"},
+}
+
+_ID3_TAGS: typing.Final = types.MappingProxyType(
+    {k.lower(): v for k, v in _ID3_TAG_NAMES.items()}
+)
+
+# frame id -> first tag info using it, for ids that aren't tag names
+_ID3_BY_FRAME: typing.Final = types.MappingProxyType(
+    {info["tag"]: info for info in reversed(_ID3_TAGS.values())}
+)
+
+_FLAC_TAGS: typing.Final = types.MappingProxyType(
+    {
         "comment": "comment",
         "origin website": "origin website",
         "website": "origin website",
@@ -213,16 +211,141 @@ class AudioInfo:
         "wwwpublisher": "wwwpublisher",
         "wwwradio": "wwwradio",
     }
+)
+
+
+# tag names are almost always the same handful of constants,
+# so the lowercasing and lookups are cached per name
+@functools.lru_cache(maxsize=256)
+def _resolve_flac_tag_id(tag: str) -> str:
+    return _FLAC_TAGS.get(tag.lower(), tag)
+
+
+@functools.lru_cache(maxsize=256)
+def _resolve_id3_tag_id(tag: str) -> str:
+    result = _ID3_TAGS.get(tag.lower(), None)
+    if isinstance(result, dict):
+        return result["tag"]
+    return tag
+
+
+@functools.lru_cache(maxsize=256)
+def _resolve_id3_tag_info(
+    tag: str,
+) -> dict[typing.Literal["tag", "class", "desc"], typing.Type[id3.Frame] | str] | None:
+    result = _ID3_TAGS.get(tag.lower(), None)
+    if isinstance(result, dict):
+        return result
+
+    return _ID3_BY_FRAME.get(tag.partition(":")[0].upper())
+
+
+def _guess_mime(head: bytes) -> str:
+    """Guess the mime type of a file from its first few bytes.
+
+    Args:
+        head (bytes): start of the file (512 bytes is plenty)
+
+    Returns:
+        str: mime type
+    """
+    # cover art is nearly always one of these, so check them before filetype
+    if head[:3] == b"\xff\xd8\xff":
+        return "image/jpeg"
+    if head[:8] == b"\x89PNG\r\n\x1a\n":
+        return "image/png"
+    if head[:4] == b"RIFF" and head[8:12] == b"WEBP":
+        return "image/webp"
+    if head[:6] in (b"GIF87a", b"GIF89a"):
+        return "image/gif"
+
+    return _filetype_mime(head)
+
+
+@functools.lru_cache(maxsize=32)
+def _filetype_mime(head: bytes) -> str:
+    return filetype.guess(head).mime
+
+
+_FILE_TYPES: typing.Final = types.MappingProxyType(
+    {
+        "flac": flac.FLAC,
+        "mp3": mp3.MP3,
+        "wav": wave.WAVE,
+    }
+)
 
-    def __init__(self, file: str) -> None:
+
+class _TagProp:
+    def __init__(self, tag: str, numeric: bool = False, doc: str = None) -> None:
+        """Property for a simple (single value) tag on `AudioInfo`.
+
+        Args:
+            tag (str): tag name
+            numeric (bool, optional): Whether the value is a number. Defaults to False.
+            doc (str, optional): Property docstring. Defaults to None.
+        """
+        self.tag = tag
+        self.numeric = numeric
+        self.__doc__ = doc
+
+    def __get__(self, obj: "AudioInfo", objtype=None):
+        if obj is None:
+            return self
+        return obj._unwrap_tag(self.tag, self.numeric)
+
+    def __set__(self, obj: "AudioInfo", value):
+        obj._set_str_tag(self.tag, value)
+
+
+class AudioInfo:
+    __slots__ = (
+        "file",
+        "audio",
+        "_tags",
+        "_type",
+        "_valid",
+        "__weakref__",
+    )
+
+    ID3_TAGS = _ID3_TAGS
+    FLAC_TAGS = _FLAC_TAGS
+
+    def __init__(
+        self,
+        file: str,
+        hint: typing.Literal["flac", "mp3", "wav"] = None,
+    ) -> None:
         """Audio info wrapper for easier and more standardized editing.
 
         Args:
-            path (str): Path to audio file.
+            file (str): Path to audio file.
+            hint (Literal["flac", "mp3", "wav"], optional): Audio format, if it's already known. Skips format detection. Defaults to None.
         """
         self.file = file
 
-        self.audio: mutagen.FileType | flac.FLAC = mutagen.File(self.file)
+        if hint is None:
+            audio: mutagen.FileType | flac.FLAC = mutagen.File(file)
+        else:
+            audio = _FILE_TYPES[hint](file)
+        self.audio = audio
+        self._valid = isinstance(audio, mutagen.FileType)
+
+        # the tags object (and so the type) never changes after loading,
+        # so work it out once instead of on every tag access
+        tags = None
+        if audio is not None:
+            if audio.tags is None:
+                audio.add_tags()
+            tags = audio.tags
+        self._tags = tags
+
+        tag_type = None
+        if isinstance(tags, (id3.ID3, wave._WaveID3)):
+            tag_type = "id3"
+        elif isinstance(tags, flac.VCFLACDict):
+            tag_type = "flac"
+        self._type = tag_type
 
     @property
     def type(
@@ -233,12 +356,7 @@ class AudioInfo:
         Returns:
             Literal["id3", "flac"]: Audio type: "id3" (mp3, wav), "flac" (flac)
         """
-        if isinstance(self.tags, (id3.ID3, wave._WaveID3)):
-            return "id3"
-        elif isinstance(self.tags, flac.VCFLACDict):
-            return "flac"
-
-        return None
+        return self._type
 
     @property
     def filename(self) -> str:
@@ -259,11 +377,7 @@ class AudioInfo:
         Returns:
             id3.ID3 | flac.VCFLACDict: mutagen audio tags dict.
         """
-        if self.audio == None:
-            return
-        if self.audio.tags == None:
-            self.audio.add_tags()
-        return self.audio.tags
+        return self._tags
 
     def _get_flac_tag_id(self, tag: str) -> str:
         """Get flac tag id. If it can't find the id for the tag name, it just returns the input.
@@ -274,7 +388,7 @@ class AudioInfo:
         Returns:
             str: tag id
         """
-        return self.FLAC_TAGS.get(tag.lower(), tag)
+        return _resolve_flac_tag_id(tag)
 
     def _get_id3_tag_id(self, tag: str) -> str:
         """Get id3 tag id. If it can't find the id for the tag name, it just returns the input.
@@ -285,10 +399,7 @@ class AudioInfo:
         Returns:
             str: tag id
         """
-        result = self.ID3_TAGS.get(tag.lower(), None)
-        if isinstance(result, dict):
-            return result["tag"]
-        return tag
+        return _resolve_id3_tag_id(tag)
 
     def get_tag_id(self, tag: str) -> str:
         """Get audio tag id. If it can't find the id for the tag name, it just returns the input.
@@ -299,11 +410,9 @@ class AudioInfo:
         Returns:
             str: tag id
         """
-        if self.type == "id3":
-            return self._get_id3_tag_id(tag)
-        elif self.type == "flac":
-            return self._get_flac_tag_id(tag)
+        return self._TAG_ID_IMPL[self._type](self, tag)
 
+    def _get_unknown_tag_id(self, tag: str) -> str:
         return tag
 
     def _get_id3_tag_info(
@@ -326,15 +435,7 @@ class AudioInfo:
         }
         ```
         """
-        result = self.ID3_TAGS.get(tag.lower(), None)
-        if isinstance(result, dict):
-            return result
-
-        real_tag = tag.split(":")[0]
-
-        for key, value in self.ID3_TAGS.items():
-            if value["tag"].upper() == real_tag.upper():
-                return value
+        return _resolve_id3_tag_info(tag)
 
     def _get_id3_tag_class(self, tag: str) -> typing.Type[id3.Frame]:
         """Get id3 tag class.
@@ -356,13 +457,19 @@ class AudioInfo:
         Args:
             tag (str): tag name
         """
-        if self.type == "flac":
-            try:
-                del self.tags[self.get_tag_id(tag)]
-            except:
-                pass
-        elif self.type == "id3":
-            return self.tags.delall(self.get_tag_id(tag))
+        return self._DEL_IMPL[self._type](self, tag)
+
+    def _del_flac_tag(self, tag: str):
+        try:
+            del self._tags[self._get_flac_tag_id(tag)]
+        except KeyError:
+            pass
+
+    def _del_id3_tag(self, tag: str):
+        return self._tags.delall(self._get_id3_tag_id(tag))
+
+    def _del_unknown_tag(self, tag: str):
+        pass
 
     def _set_flac_tag(self, tag: str, value: str | int | float | list[str]):
         """Set flac tag
@@ -375,9 +482,9 @@ class AudioInfo:
             ValueError: cannot set flac tag {tag} to {value}
         """
         try:
-            self.tags[self.get_tag_id(tag)] = value
-        except:
-            raise ValueError(f"cannot set flac tag {tag} to {value}")
+            self._tags[self._get_flac_tag_id(tag)] = value
+        except (TypeError, ValueError) as e:
+            raise ValueError(f"cannot set flac tag {tag} to {value}") from e
 
     def _set_id3_tag(self, tag: str, *args, **kwargs):
         """Set id3 tag. Arguments are passed into the id3 Frame, so if you need specific arguments, you'll have to look it up yourself.
@@ -389,23 +496,22 @@ class AudioInfo:
 
         usually the `text` argument is what's needed.
         """
+        tag_info = self._get_id3_tag_info(tag)
+        if tag_info is None:
+            return
+
+        kwargs.setdefault("desc", tag_info.get("desc", ""))
+
         try:
-            tag_info = self._get_id3_tag_info(tag)
-            desc = kwargs.get("desc", tag_info.get("desc", ""))
-            # logging.info(desc)
-
-            return self.tags.add(tag_info["class"](*args, desc=desc, **kwargs))
-        except:
-            class_ = self._get_id3_tag_class(tag)
-            if not class_:
-                return
-            try:
-                self.tags[self.get_tag_id(tag)] = class_(*args, **kwargs)
-            except:
-                if not "text" in kwargs:
-                    kwargs["text"] = args[0]
-                    args = args[1:]
-                    self.tags[self.get_tag_id(tag)] = class_(*args, **kwargs)
+            frame = tag_info["class"](*args, **kwargs)
+        except (TypeError, ValueError):
+            # the first positional argument is probably the text, not the encoding
+            if len(args) == 0 or "text" in kwargs:
+                raise
+            kwargs["text"] = args[0]
+            frame = tag_info["class"](*args[1:], **kwargs)
+
+        return self._tags.add(frame)
 
     def set_tag(self, tag: str, *args, **kwargs):
         """Set tag.
@@ -418,18 +524,19 @@ class AudioInfo:
 
         id3 tags can take specific arguments, but flac tags just take the first argument as it's value.
         """
-        if self.type == "id3":
-            return self._set_id3_tag(tag, *args, **kwargs)
-        elif self.type == "flac":
-            value = None
+        return self._SET_IMPL[self._type](self, tag, *args, **kwargs)
+
+    def _set_flac_tag_args(self, tag: str, *args, **kwargs):
+        value = None
 
-            if len(args) == 0 and len(kwargs) > 0:
-                value = list(kwargs.items())[0][1]
-            elif len(args) > 0:
-                value = args[0]
+        if len(args) == 0 and len(kwargs) > 0:
+            value = next(iter(kwargs.values()))
+        elif len(args) > 0:
+            value = args[0]
 
-            return self._set_flac_tag(tag, value)
+        return self._set_flac_tag(tag, value)
 
+    def _set_unknown_tag(self, tag: str, *args, **kwargs):
         raise ValueError("unknown audio file type")
 
     def _get_flac_tag(self, tag: str) -> str | None:
@@ -441,7 +548,7 @@ class AudioInfo:
         Returns:
             str | None: tag value
         """
-        return self.tags.get(self._get_flac_tag_id(tag), [None])[0]
+        return self._tags.get(self._get_flac_tag_id(tag), [None])[0]
 
     def _get_id3_tag(self, tag: str) -> list[id3.Frame] | id3.Frame:
         """Get id3 tag. This returns the id3.Frame object. If there are multiple id3 tags, it returns a list of all of them.
@@ -452,7 +559,7 @@ class AudioInfo:
         Returns:
             list[id3.Frame] | id3.Frame: list of all the id3 tags, or the only id3 tag.
         """
-        value = self.tags.getall(self.get_tag_id(tag))
+        value = self._tags.getall(self._get_id3_tag_id(tag))
 
         if len(value) == 1:
             return value[0]
@@ -468,10 +575,10 @@ class AudioInfo:
         Returns:
             list[id3.Frame] | id3.Frame | str: tag value
         """
-        if self.type == "id3":
-            return self._get_id3_tag(tag)
-        elif self.type == "flac":
-            return self._get_flac_tag(tag)
+        return self._GET_IMPL[self._type](self, tag)
+
+    def _get_unknown_tag(self, tag: str) -> None:
+        return None
 
     def get_tag(self, tag: str) -> str:
         """Get tag value as a string. If it's an id3 tag, it will try to get the text. This will also only get the first instance of a tag.
@@ -482,20 +589,15 @@ class AudioInfo:
         Returns:
             str: tag value.
         """
-        value = self.get_raw_tag(tag)
+        return self._GET_STR_IMPL[self._type](self, tag)
 
-        if isinstance(value, list):
-            if len(value) == 0:
-                return
-            value = value[0]
-
-        if isinstance(value, id3.Frame):
-            try:
-                value = value.text[0]
-            except:
-                value = None
+    def _get_str_id3_tag(self, tag: str) -> str | None:
+        frames = self._tags.getall(self._get_id3_tag_id(tag))
+        if len(frames) == 0:
+            return
 
-        return value
+        text = getattr(frames[0], "text", None)
+        return text[0] if text else None
 
     def convert_to(self, type: str = None):
         pass
@@ -508,442 +610,76 @@ class AudioInfo:
             *args (Any): additional parameters to pass into the save function.
             **kwargs (Any): additional parameters to pass into the save function.
         """
-        try:
+        if self._type == "id3":
             self.audio.save(file, v2_version=v2_version, *args, **kwargs)
-        except:
+        else:
             self.audio.save(file, *args, **kwargs)
 
     def clear(self):
         """Clear all tags."""
         self.audio.clear()
 
-    @property
-    def track(self) -> float:
-        """Track number
-
-        Returns:
-            float: track number
-        """
-        if not isinstance(self.audio, mutagen.FileType):
-            return
-
-        track = self.get_raw_tag("track")
-
-        if track == None:
-            return
-
-        if isinstance(track, str | int | float):
-            return float(track)
-
-        if isinstance(track, list):
-            if len(track) == 0:
-                return
-            track = track[0]
-
-        text = track.text
-
-        if isinstance(text, list) and len(text) == 1:
-            try:
-                text = float(text[0])
-            except:
-                text = text[0]
-
-        return text
-
-    @track.setter
-    def track(self, track: int):
-        """Set track number.
-
-        Args:
-            track (int): Track number
-        """
-        if not isinstance(self.audio, mutagen.FileType):
-            return
-
-        if not isinstance(track, (list, tuple, set)):
-            track = [str(track)]
-
-        self.set_tag("track", text=list(track))
-
-    @property
-    def disk(self) -> float:
-        """Disk number.
-
-        Returns:
-            float: disk number
-        """
-        if not isinstance(self.audio, mutagen.FileType):
-            return
-
-        disk = self.get_raw_tag("disk")
-
-        if disk == None:
-            return
-
-        if isinstance(disk, str | int | float):
-            return float(disk)
-
-        if isinstance(disk, list):
-            if len(disk) == 0:
-                return
-            disk = disk[0]
-
-        text = disk.text
-
-        if isinstance(text, list) and len(text) == 1:
-            try:
-                text = float(text[0])
-            except:
-                text = text[0]
-
-        return text
-
-    @disk.setter
-    def disk(self, disk: int):
-        """Set disk number.
-
-        Args:
-            disk (int): disk number
-        """
-        if not isinstance(self.audio, mutagen.FileType):
-            return
-
-        if not isinstance(disk, (list, tuple, set)):
-            disk = [str(disk)]
-
-        self.set_tag("disk", text=list(disk))
-
-    @property
-    def disc(self) -> float:
-        """Disc number.
-
-        Returns:
-            float: disc number
-
-        Alias for `self.disk`
-        """
-        return self.disk
-
-    @disc.setter
-    def disc(self, disc):
-        """Set disc number.
-
-        Args:
-            disc (int): disc number
-
-        Alias for `self.disk`
-        """
-        self.disk = disc
-
-    @property
-    def cd(self) -> float:
-        """CD number.
-
-        Returns:
-            float: CD number
-
-        Alias for `self.disk`
-        """
-        return self.disk
-
-    @cd.setter
-    def cd(self, disk: int):
-        """Set CD number.
-
-        Args:
-            cd (int): CD number
-
-        Alias for `self.disk`
-        """
-        self.disk = disk
-
-    @property
-    def title(self) -> str:
-        """Track title
-
-        Returns:
-            str: track title
-        """
-        if not isinstance(self.audio, mutagen.FileType):
-            return
-
-        title = self.get_raw_tag("title")
-
-        if title == None:
-            return
-
-        if isinstance(title, str | int | float):
-            return title
-
-        if isinstance(title, list):
-            if len(title) == 0:
-                return
-            title = title[0]
-
-        text = title.text
-
-        if isinstance(text, list) and len(text) == 1:
-            try:
-                text = float(text[0])
-            except:
-                text = text[0]
-
-        return text
-
-    @title.setter
-    def title(self, title: str):
-        """Track title
-
-        Args:
-            title (str): track title
-        """
-        if not isinstance(self.audio, mutagen.FileType):
-            return
-
-        if not isinstance(title, (list, tuple, set)):
-            title = [str(title)]
-
-        self.set_tag("title", text=list(title))
-
-    @property
-    def album(self) -> str:
-        """Album
-
-        Returns:
-            str: album
-        """
-        if not isinstance(self.audio, mutagen.FileType):
-            return
-
-        album = self.get_raw_tag("album")
-
-        if album == None:
-            return
-
-        if isinstance(album, str | int | float):
-            return album
-
-        if isinstance(album, list):
-            if len(album) == 0:
-                return
-            album = album[0]
-
-        text = album.text
-
-        if isinstance(text, list) and len(text) == 1:
-            try:
-                text = float(text[0])
-            except:
-                text = text[0]
-
-        return text
-
-    @album.setter
-    def album(self, album: str):
-        """Album
-
-        Args:
-            album (str): album name
-        """
-        if not isinstance(self.audio, mutagen.FileType):
-            return
-
-        if not isinstance(album, (list, tuple, set)):
-            album = [str(album)]
-
-        self.set_tag("album", text=list(album))
-
-    @property
-    def publisher(self) -> str:
-        """Publisher or organization.
-
-        Returns:
-            str: publisher or organization
-        """
-        if not isinstance(self.audio, mutagen.FileType):
-            return
-
-        publisher = self.get_raw_tag("publisher")
-
-        if publisher == None:
-            return
-
-        if isinstance(publisher, str | int | float):
-            return publisher
-
-        if isinstance(publisher, list):
-            if len(publisher) == 0:
-                return
-            publisher = publisher[0]
-
-        text = publisher.text
-
-        if isinstance(text, list) and len(text) == 1:
-            try:
-                text = float(text[0])
-            except:
-                text = text[0]
-
-        return text
-
-    @publisher.setter
-    def publisher(self, publisher: str):
-        """Publisher or organization
-
-        Args:
-            publisher (str): publisher
-        """
-        if not isinstance(self.audio, mutagen.FileType):
-            return
-
-        if not isinstance(publisher, (list, tuple, set)):
-            publisher = [str(publisher)]
-
-        self.set_tag("publisher", text=list(publisher))
-
-    @property
-    def artist(self) -> str:
-        """Artist
-
-        Returns:
-            str: artist
-        """
-        if not isinstance(self.audio, mutagen.FileType):
-            return
-
-        artist = self.get_raw_tag("artist")
-
-        if artist == None:
-            return
-
-        if isinstance(artist, str | int | float):
-            return artist
-
-        if isinstance(artist, list):
-            if len(artist) == 0:
-                return
-            artist = artist[0]
-
-        text = artist.text
-
-        if isinstance(text, list) and len(text) == 1:
-            try:
-                text = float(text[0])
-            except:
-                text = text[0]
-
-        return text
-
-    @artist.setter
-    def artist(self, artist: str):
-        """Artist
-
-        Args:
-            artist (str): artist
-        """
-        if not isinstance(self.audio, mutagen.FileType):
-            return
-
-        if not isinstance(artist, (list, tuple, set)):
-            artist = [str(artist)]
-
-        self.set_tag("artist", text=list(artist))
-
-    @property
-    def band(self) -> str:
-        """Band or album artist
-
-        Returns:
-            str: band or album artist
-        """
-        if not isinstance(self.audio, mutagen.FileType):
-            return
-
-        band = self.get_raw_tag("band")
-
-        if band == None:
-            return
-
-        if isinstance(band, str | int | float):
-            return band
-
-        if isinstance(band, list):
-            if len(band) == 0:
-                return
-            band = band[0]
-
-        text = band.text
+    track = _TagProp("track", numeric=True, doc="Track number")
+    disk = _TagProp("disk", numeric=True, doc="Disk number")
+    disc = _TagProp("disk", numeric=True, doc="Disc number. Alias for `self.disk`")
+    cd = _TagProp("disk", numeric=True, doc="CD number. Alias for `self.disk`")
+    title = _TagProp("title", doc="Track title")
+    album = _TagProp("album", doc="Album")
+    publisher = _TagProp("publisher", doc="Publisher or organization")
+    artist = _TagProp("artist", doc="Artist")
+    band = _TagProp("band", doc="Band or album artist")
+    genre = _TagProp("genre", doc="Genre")
 
-        if isinstance(text, list) and len(text) == 1:
-            try:
-                text = float(text[0])
-            except:
-                text = text[0]
-
-        return text
-
-    @band.setter
-    def band(self, band: str):
-        """Band or album artist
+    def _unwrap_tag(self, tag: str, numeric: bool = False) -> str | float | None:
+        """Get the text of a simple (single value) tag.
 
         Args:
-            band (str): band or album artist
-        """
-        if not isinstance(self.audio, mutagen.FileType):
-            return
-
-        if not isinstance(band, (list, tuple, set)):
-            band = [str(band)]
-
-        self.set_tag("band", text=list(band))
-
-    @property
-    def genre(self) -> str:
-        """Genre
+            tag (str): tag name
+            numeric (bool, optional): Convert flac values to float. Defaults to False.
 
         Returns:
-            str: genre
+            str | float | None: tag value
         """
-        if not isinstance(self.audio, mutagen.FileType):
+        if not self._valid:
             return
 
-        genre = self.get_raw_tag("genre")
+        value = self._GET_IMPL[self._type](self, tag)
 
-        if genre == None:
+        if value == None:
             return
 
-        if isinstance(genre, str | int | float):
-            return genre
+        if isinstance(value, str | int | float):
+            return float(value) if numeric else value
 
-        if isinstance(genre, list):
-            if len(genre) == 0:
+        if isinstance(value, list):
+            if len(value) == 0:
                 return
-            genre = genre[0]
+            value = value[0]
 
-        text = genre.text
+        text = value.text
 
         if isinstance(text, list) and len(text) == 1:
-            try:
-                text = float(text[0])
-            except:
-                text = text[0]
+            text = text[0]
+            # most tags aren't numbers, so check before converting instead of catching the error
+            if isinstance(text, str) and _FLOAT_RE.fullmatch(text):
+                text = float(text)
 
         return text
 
-    @genre.setter
-    def genre(self, genre: str):
-        """Genre
+    def _set_str_tag(self, tag: str, value: typing.Any):
+        """Set the text of a simple (single value) tag.
 
         Args:
-            genre (str): genre
+            tag (str): tag name
+            value (Any): value, or list of values
         """
-        if not isinstance(self.audio, mutagen.FileType):
+        if not self._valid:
             return
 
-        if not isinstance(genre, (list, tuple, set)):
-            genre = [str(genre)]
+        if not isinstance(value, (list, tuple, set)):
+            value = [str(value)]
 
-        self.set_tag("genre", text=list(genre))
+        self.set_tag(tag, text=list(value))
 
     @property
     def cover_art(self) -> Image.Image:
@@ -952,18 +688,18 @@ class AudioInfo:
         Returns:
             PIL.Image.Image: Cover art as a PIL.Image.Image object
         """
-        if not isinstance(self.audio, mutagen.FileType):
+        if not self._valid:
             return
 
-        if self.type == "id3":
-            artwork = self.get_raw_tag("picture")
+        if self._type == "id3":
+            artwork = self._GET_IMPL[self._type](self, "picture")
             if isinstance(artwork, list):
                 if len(artwork) == 0:
                     return
                 artwork = artwork[0]
 
             data = artwork.data
-        elif self.type == "flac":
+        elif self._type == "flac":
             if len(self.audio.pictures) == 0:
                 return
 
@@ -974,12 +710,7 @@ class AudioInfo:
         if data == b"":
             return
 
-        file = io.BytesIO(data)
-        file.seek(0)
-
-        image = Image.open(file)
-
-        return image
+        return Image.open(io.BytesIO(data))
 
     @cover_art.setter
     def cover_art(self, image: str | bytes | Image.Image):
@@ -994,30 +725,25 @@ class AudioInfo:
         if not isinstance(image, (str, bytes, Image.Image)):
             raise TypeError("image must be path, bytes or PIL.Image")
 
-        mime = ""
-        data = b""
-
-        if isinstance(image, bytes):
-            mime = filetype.guess(image).mime
-            data = image
-
-        if isinstance(image, str):
-            with open(image, "rb") as file:
-                data = file.read()
-
-            mime = filetype.guess(data).mime
-
         if isinstance(image, Image.Image):
             file = io.BytesIO()
-
             image.save(file, format="JPEG")
 
             data = file.getvalue()
-            mime = filetype.guess(data).mime
+            mime = "image/jpeg"
+            size = image.size
+        else:
+            if isinstance(image, str):
+                with open(image, "rb") as file:
+                    data = file.read()
+            else:
+                data = image
 
-        pil_image = Image.open(io.BytesIO(data))
+            # the file signature is all that is needed
+            mime = _guess_mime(data[:512])
+            size = None
 
-        if self.type == "id3":
+        if self._type == "id3":
             self.del_tag("picture")
 
             self.set_tag(
@@ -1029,15 +755,17 @@ class AudioInfo:
                 data=data,
             )
 
-        elif self.type == "flac":
+        elif self._type == "flac":
             self.audio.clear_pictures()
 
             picture = flac.Picture()
             picture.data = data
             picture.type = id3.PictureType.COVER_FRONT
             picture.mime = mime
-            picture.width = pil_image.width
-            picture.height = pil_image.height
+            if size is None:
+                # only reads the image header, not the pixel data
+                size = Image.open(io.BytesIO(data)).size
+            picture.width, picture.height = size
 
             self.audio.add_picture(picture)
 
@@ -1045,3 +773,63 @@ class AudioInfo:
             raise NotImplementedError(
                 "I don't know how to add a picture to that audio file."
             )
+
+    # format specific implementations, keyed by `type`, so the public methods
+    # don't have to check the type on every call. These are plain functions
+    # rather than bound methods stored on the instance, which would keep every
+    # AudioInfo alive in a reference cycle until the garbage collector runs.
+    _TAG_ID_IMPL = {
+        "id3": _get_id3_tag_id,
+        "flac": _get_flac_tag_id,
+        None: _get_unknown_tag_id,
+    }
+    _GET_IMPL = {
+        "id3": _get_id3_tag,
+        "flac": _get_flac_tag,
+        None: _get_unknown_tag,
+    }
+    _GET_STR_IMPL = {
+        "id3": _get_str_id3_tag,
+        # flac values are already strings
+        "flac": _get_flac_tag,
+        None: _get_unknown_tag,
+    }
+    _SET_IMPL = {
+        "id3": _set_id3_tag,
+        "flac": _set_flac_tag_args,
+        None: _set_unknown_tag,
+    }
+    _DEL_IMPL = {
+        "id3": _del_id3_tag,
+        "flac": _del_flac_tag,
+        None: _del_unknown_tag,
+    }
+
+
+def _apply_one(file: str, func: typing.Callable[[AudioInfo], typing.Any]):
+    info = AudioInfo(file)
+    func(info)
+    info.save()
+
+
+def batch_apply(
+    files: typing.Iterable[str],
+    func: typing.Callable[[AudioInfo], typing.Any],
+    workers: int = None,
+):
+    """Edit the tags of a lot of files in parallel. Each file is loaded into an `AudioInfo`, passed to `func`, and then saved.
+
+    Args:
+        files (Iterable[str]): Paths to audio files.
+        func (Callable[[AudioInfo], Any]): Function that edits the `AudioInfo`. It's sent to other processes, so it has to be picklable (e.g. a module level function).
+        workers (int, optional): Number of processes. Defaults to the cpu count.
+    """
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as executor:
+        # list() so exceptions from the workers get raised here
+        list(
+            executor.map(
+                functools.partial(_apply_one, func=func),
+                files,
+                chunksize=8,
+            )
+        )
@@ -49,7 +49,7 @@ class AdjustableFade(Effect):
             numpy.ndarray[float]: numpy array
         """
         if (gain0 == gain1):
-            return numpy.array([gain0] * length)
+            return numpy.full(length, gain0, dtype = numpy.float32)
         elif ((curve_ratio > 0) and (curve_ratio < 0.5)):
             _curve_ratio = curve_ratio * 2
             return ((self.scale_curve(gain0, gain1, self.linear(gain0, gain1, length)) * (1 - _curve_ratio)) +
@@ -82,7 +82,12 @@ class AdjustableFade(Effect):
         gain1: float,
         length: int,
     ) -> numpy.ndarray[float]:
-        return numpy.linspace(gain0, gain1, length)
+        # same values as numpy.linspace (including both ends), built in place
+        step = (gain1 - gain0) / max(length - 1, 1)
+        line = numpy.arange(length, dtype = numpy.float32)
+        line *= step
+        line += gain0
+        return line
             
 
     def cosine_curve(
@@ -102,7 +107,14 @@ class AdjustableFade(Effect):
             numpy.ndarray: numpy array
         """
         phase = 1 if (gain0 > gain1) else -1
-        return (numpy.cos(numpy.deg2rad((numpy.arange(length) / length) * 180)) * phase + 1) * 0.5
+        # work in radians in one buffer, instead of converting from degrees
+        step = (numpy.pi / length) if length else 0.0
+        curve = numpy.arange(length, dtype = numpy.float32)
+        curve *= step
+        numpy.cos(curve, out = curve)
+        curve *= 0.5 * phase
+        curve += 0.5
+        return curve
 
     def cos_curve(
         self,
@@ -120,8 +132,16 @@ class AdjustableFade(Effect):
         power: float,
         env: numpy.ndarray[float],
     ) -> numpy.ndarray[float]:
-        value = self.scale_curve(gain0, gain1,
-            (env if (power == 1) else numpy.exp(power * numpy.log(env))))
+        if power == 1:
+            curve = env
+        elif power == 2:
+            curve = numpy.square(env)
+        elif power == 0.5:
+            curve = numpy.sqrt(env)
+        else:
+            curve = numpy.power(env, power)
+
+        value = self.scale_curve(gain0, gain1, curve)
         logging.debug(value)
         return value
 
@@ -1,14 +1,29 @@
+import re
+
+
+# same strings that int() and float() accept (apart from underscores, nan and inf),
+# checked up front so non-numbers don't raise (also used by audio_info)
+_INT_RE = re.compile(r'\s*[+-]?\d+\s*')
+_FLOAT_RE = re.compile(r'\s*[+-]?(\d+\.?\d*|\.\d+)([eE][+-]?\d+)?\s*')
+
 class SafeFormatDict(dict):
     def __missing__(self, key):
         return f'{{{key}}}'
 
 def format(string: str, **values: dict[str,str]):
-    for key in values:
+    for key, value in values.items():
+        if isinstance(value, str):
+            if _INT_RE.fullmatch(value):
+                values[key] = int(value)
+            elif _FLOAT_RE.fullmatch(value):
+                values[key] = float(value)
+            continue
+
         try:
-            values[key] = int(values[key])
-        except:
+            values[key] = int(value)
+        except (TypeError, ValueError, OverflowError):
             try:
-                values[key] = float(values[key])
-            except:
+                values[key] = float(value)
+            except (TypeError, ValueError):
                 pass
     return string.format_map(SafeFormatDict(values))
@@ -59,9 +59,11 @@ import logging
 import sys
 import os
 import pathvalidate
+import json
 import json5
 from copy import deepcopy
 import csv
+import numpy
 
 from audioman import Audio
 from audioman.effect import effects
@@ -69,6 +71,21 @@ from audioman.effect import effects
 from .format import format
 
 
+def load_json(text: str):
+    """Parse a json5 string. Plain json is tried first, since the stdlib parser is much faster than json5.
+
+    Args:
+        text (str): json5 text
+
+    Returns:
+        Any: parsed data
+    """
+    try:
+        return json.loads(text)
+    except json.JSONDecodeError:
+        return json5.loads(text)
+
+
 def merge_dicts(from_, to):
     for key in from_:
         if key not in to:
@@ -155,15 +172,15 @@ class SoundtrackMaker:
             self.config = config
         elif isinstance(config, str):
             try:
-                self.config = json5.loads(config)
+                self.config = load_json(config)
             except:
                 with open(config, "r") as file:
-                    self.config = json5.load(file)
+                    self.config = load_json(file.read())
 
                 self.base_path = os.path.dirname(config)
 
         elif hasattr(config, "read"):
-            self.config = json5.load(config)
+            self.config = load_json(config.read())
         else:
             raise TypeError("cannot open config")
 
@@ -272,7 +289,7 @@ class SoundtrackMaker:
 
                     filename = os.path.join(dir, name)
                     with open(filename, "r") as file:
-                        data = json5.load(file)
+                        data = load_json(file.read())
 
                     track = {
                         "track": data,
@@ -286,8 +303,10 @@ class SoundtrackMaker:
     ):
         self.get_tracks()
         
-        for track in self.tracks:
-            self.make_track(track)
+        # scoped so importing maker doesn't change numpy's global error state
+        with numpy.errstate(all = 'warn'):
+            for track in self.tracks:
+                self.make_track(track)
 
     def make_track(
         self,
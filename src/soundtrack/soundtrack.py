@@ -1,4 +1,5 @@
 
+import concurrent.futures
 import logging
 import os
 import pathlib
@@ -13,6 +14,23 @@ import csv
 from audioman import AudioTags
 
 
+def _scan_files(path: str):
+    """Recursively yield the files in a folder. Uses `os.scandir`, so the file type usually comes from the directory listing, instead of a separate stat per file.
+
+    Args:
+        path (str): folder
+
+    Yields:
+        os.DirEntry: file entry
+    """
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks = False):
+                yield from _scan_files(entry.path)
+            elif entry.is_file():
+                yield entry
+
+
 class Soundtrack:
     def __init__(
         self,
@@ -106,7 +124,16 @@ class Soundtrack:
         
         with open(self.spreadsheet_filename, newline = '', mode = 'r') as file:
             reader = csv.DictReader(file)
-            self.spreadsheet = list(reader)
+            # trim every cell once here instead of every time a track is matched.
+            # extra cells are listed under a None key and missing cells are None,
+            # so only plain string pairs are kept
+            self.spreadsheet = [
+                {
+                    key.strip(): value.strip() for key, value in row.items()
+                    if isinstance(key, str) and isinstance(value, str)
+                }
+                for row in reader
+            ]
     
     def get_track_csv_metadata(self, track: AudioTags) -> dict[str,str] | None:
         """Get the metadata for the track from the csv spreadsheet
@@ -125,13 +152,13 @@ class Soundtrack:
         result = None
         
         def check(value: str):
-            if reference.strip().lower() == 'filename':
+            if reference.lower() == 'filename':
                 return os.path.basename(track.filename).lower() == value.lower() or \
                         os.path.splitext(os.path.basename(track.filename))[0].lower() == value.lower()
             
-            tag_value = track.get(reference.strip().lower())
+            tag_value = track.get(reference.lower())
 #             logging.info(f"""track: {track}
-# tag: '{reference.strip().lower()}'
+# tag: '{reference.lower()}'
 # tag_value: '{tag_value}'
 # value: '{value}'""")
             if tag_value == None:
@@ -140,7 +167,7 @@ class Soundtrack:
             return tag_value.lower() == value.lower()
         
         for row in self.spreadsheet:
-            value = row[reference].strip()
+            value = row[reference]
             if check(value):
                 result = row
                 break
@@ -169,8 +196,8 @@ class Soundtrack:
             if key == keys[0]:
                 continue
             
-            value = metadata[key].strip()
-            tag = key.strip()
+            value = metadata[key]
+            tag = key
             
             logging.info(f'setting tag {tag} to {value}')
             
@@ -213,35 +240,39 @@ class Soundtrack:
         self.files = []
         self.audio: list[AudioTags] = []
 
-        included_files = []
+        included_files = set()
         
-        for dir, dirnames, files in os.walk(self.path):
-            for file in files:
-                filename = os.path.join(dir, file)
-                if os.path.isfile(filename):
-                    included_files.append(file)
-                logging.info(file)
+        for entry in _scan_files(self.path):
+            included_files.add(entry.name)
+            logging.info(entry.name)
                 
 
         if isinstance(self.output, str):
             shutil.copytree(self.path, self.output, dirs_exist_ok=True)
 
-            path = pathlib.Path(self.output)
+            path = self.output
         else:
-            path = pathlib.Path(self.path)
+            path = self.path
 
-        files = path.glob("**/**/*")
-        # logging.info(list(files))
         files = [
-            file for file in files if file.is_file() and file.name in included_files
+            pathlib.Path(entry.path).as_posix() for entry in _scan_files(path) if entry.name in included_files
         ]
 
-        for file in files:
-            audio = AudioTags(file.as_posix())
+        # tag parsing holds the GIL, so threads only help by overlapping file reads.
+        # a few workers is enough for that, and not worth starting for a couple files
+        if len(files) <= 2:
+            audios = [AudioTags(file) for file in files]
+        else:
+            with concurrent.futures.ThreadPoolExecutor(
+                max_workers = min(8, len(files)),
+            ) as executor:
+                audios = list(executor.map(AudioTags, files))
+
+        for file, audio in zip(files, audios):
             if audio.filename == None:
                 continue
 
-            self.files.append(file.as_posix())
+            self.files.append(file)
 
             self.audio.append(audio)
 